@@ -1,6 +1,8 @@
 import os
 from contextlib import contextmanager
 from typing import (
+    Any,
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -20,7 +22,7 @@ from .sections import (
     GDSectionHeader,
     GDSubResourceSection,
 )
-from .structure import scene_file
+from .structure import parse_scene_file
 from .util import find_project_root, gdpath_to_filepath
 
 __all__ = ["GDFile", "GDScene", "GDResource"]
@@ -37,6 +39,37 @@ SCENE_ORDER = [
     "connection",
     "editable",
 ]
+SCENE_ORDER_RANK = {name: i for i, name in enumerate(SCENE_ORDER)}
+
+# Scene files can be several MB, so read and write them in large chunks
+FILE_BUFFER_SIZE = 1 << 20
+
+# Section types that count towards load_steps
+RESOURCE_SECTIONS = frozenset(("ext_resource", "sub_resource"))
+
+# Values that cannot contain resource references
+SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+SENTINEL = object()
+
+
+def _section_rank(section: GDSection) -> int:
+    # Unknown section types sort to the end
+    return SCENE_ORDER_RANK.get(section.header.name, len(SCENE_ORDER))
+
+
+def _insertion_index(sections: Sequence[GDSection], rank: int) -> int:
+    """Binary search for the first section that sorts after rank"""
+    # Ranks are read from the headers as we go, so renamed sections are accounted for
+    lo, hi = 0, len(sections)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if rank < _section_rank(sections[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
 
 
 GDFileType = TypeVar("GDFileType", bound="GDFile")
@@ -56,26 +89,23 @@ class GDFile(object):
 
     def add_section(self, new_section: GDSection) -> int:
         """Add a section to the file and return the index of that section"""
-        new_idx = SCENE_ORDER.index(new_section.header.name)
-        for i, section in enumerate(self._sections):
-            idx = SCENE_ORDER.index(section.header.name)
-            if new_idx < idx:  # type: ignore
-                self._sections.insert(i, new_section)
-                return i
-        self._sections.append(new_section)
-        return len(self._sections) - 1
+        i = _insertion_index(self._sections, _section_rank(new_section))
+        self._sections.insert(i, new_section)
+        return i
 
     def remove_section(self, section: GDSection) -> bool:
         """Remove a section from the file"""
-        idx = -1
+        # Callers almost always pass in the section object itself, which is much
+        # cheaper to find than an equal section
+        for i, s in enumerate(self._sections):
+            if s is section:
+                self.remove_at(i)
+                return True
         for i, s in enumerate(self._sections):
             if section == s:
-                idx = i
-                break
-        if idx == -1:
-            return False
-        self.remove_at(idx)
-        return True
+                self.remove_at(i)
+                return True
+        return False
 
     def remove_at(self, index: int) -> GDSection:
         """Remove a section at an index"""
@@ -158,33 +188,29 @@ class GDFile(object):
         **constraints
     ) -> Iterable[GDSection]:
         """Same as find_section, but returns all matches"""
+        header_checks = tuple(constraints.items())
+        property_checks = tuple((property_constraints or {}).items())
         for section in self.get_sections(section_name_):
-            found = True
-            for k, v in constraints.items():
-                if getattr(section, k, None) == v:
-                    continue
-                if section.header.get(k) == v:
-                    continue
-                found = False
-                break
-            if property_constraints is not None:
-                for k, v in property_constraints.items():
+            for k, v in header_checks:
+                if getattr(section, k, SENTINEL) != v and section.header.get(k) != v:
+                    break
+            else:
+                for k, v in property_checks:
                     if section.get(k) != v:
-                        found = False
                         break
-            if found:
-                yield section
+                else:
+                    yield section
 
     def add_ext_resource(self, path: str, type: str) -> GDExtResourceSection:
         """Add an ext_resource"""
-        next_id = 1 + max([s.id for s in self.get_ext_resources()] + [0])
+        next_id = 1 + max((s.id for s in self.get_ext_resources()), default=0)
         section = GDExtResourceSection(path, type, next_id)
         self.add_section(section)
         return section
 
     def add_sub_resource(self, type: str, **kwargs) -> GDSubResourceSection:
         """Add a sub_resource"""
-        next_id = 1 + max([s.id for s in self.get_sub_resources()] + [0])
+        next_id = 1 + max((s.id for s in self.get_sub_resources()), default=0)
         section = GDSubResourceSection(type, next_id, **kwargs)
         self.add_section(section)
         return section
@@ -262,12 +288,13 @@ class GDFile(object):
         return GDScene.load(gdpath_to_filepath(self.project_root, parent_res.path))
 
     @contextmanager
-    def use_tree(self):
+    def use_tree(self, readonly: bool = False):
         """
         Helper API for working with the nodes in a tree structure
 
         This temporarily builds the nodes into a tree, and flattens them back into the
-        GD file format when done.
+        GD file format when done. Pass readonly=True to skip flattening if you will
+        only read from the tree.
 
         Example::
 
@@ -281,65 +308,113 @@ class GDFile(object):
 
         tree = Tree.build(self)
         yield tree
-        for i in range(len(self._sections) - 1, -1, -1):
-            section = self._sections[i]
-            if section.header.name == "node":
-                self._sections.pop(i)
-        nodes = tree.flatten()
-        if not nodes:
+        if readonly:
             return
-        # Let's find out where the root node belongs and then bulk add the rest at that
-        # index
-        i = self.add_section(nodes[0])
-        self._sections[i + 1 : i + 1] = nodes[1:]
+        nodes = tree.flatten()
+        # Drop the old node sections and splice the flattened ones in where they belong
+        sections = [s for s in self._sections if s.header.name != "node"]
+        i = _insertion_index(sections, SCENE_ORDER_RANK["node"])
+        sections[i:i] = nodes
+        self._sections = sections
 
     def get_node(self, path: str = ".") -> Optional[GDNodeSection]:
         """Mimics the Godot get_node API"""
-        with self.use_tree() as tree:
-            if tree.root is None:
+        sections_by_path = self._node_sections_by_path()
+        if sections_by_path is None:
+            # Inherited scenes need the parent scene, which means building the tree
+            with self.use_tree(readonly=True) as tree:
+                return tree.get_section(path)
+        if "." not in sections_by_path:
+            return None
+        # Resolve one piece at a time, the same way Node.get_node does. That means a "."
+        # piece is looked up as a child name, which no node has.
+        node_path = None
+        while path not in (".", ""):
+            piece, _, path = path.partition("/")
+            if piece == ".":
                 return None
-            node = tree.root.get_node(path)
-        return node.section if node is not None else None
+            node_path = piece if node_path is None else node_path + "/" + piece
+            if node_path not in sections_by_path:
+                return None
+        return sections_by_path[node_path or "."]
+
+    def _node_sections_by_path(self) -> Optional[Dict[str, GDNodeSection]]:
+        """
+        Map the path of every node to its section without building a tree
+
+        Returns None if the scene inherits from another scene
+        """
+        from .tree import TreeMutationException
+
+        sections_by_path: Dict[str, GDNodeSection] = {}
+        for section in self.get_nodes():
+            parent = section.parent
+            if parent is None:
+                if section.instance is not None:
+                    return None
+                sections_by_path = {".": section}
+                continue
+            if parent not in sections_by_path:
+                raise TreeMutationException(
+                    "Cannot find parent node %s of %s" % (parent, section.name)
+                )
+            if parent == ".":
+                sections_by_path[section.name] = section
+            else:
+                sections_by_path[parent + "/" + section.name] = section
+        return sections_by_path
 
     @classmethod
     def parse(cls: Type[GDFileType], contents: str) -> GDFileType:
         """Parse the contents of a Godot file"""
-        return cls.from_parser(scene_file.parse_string(contents, parseAll=True))
+        if cls is GDFile and not contents.strip(" \t\r\n"):
+            # Nothing to parse; don't bother spinning up pyparsing. Scenes and resources
+            # need a header, so an empty one still fails to parse below.
+            return cls()
+        return cls.from_parser(parse_scene_file(contents))
 
     @classmethod
     def load(cls: Type[GDFileType], filepath: str) -> GDFileType:
-        with open(filepath, "r", encoding="utf-8") as ifile:
-            try:
-                file = cls.parse(ifile.read())
-            except UnicodeDecodeError:
-                raise NotImplementedError(  # pylint: disable=W0707
-                    "Error loading %s: godot_parser does not support binary scenes"
-                    % filepath
-                )
+        # Decoding the whole file at once is much faster than decoding it in chunks
+        # through a text-mode file
+        with open(filepath, "rb") as ifile:
+            data = ifile.read()
+        try:
+            contents = data.decode("utf-8")
+        except UnicodeDecodeError:
+            raise NotImplementedError(  # pylint: disable=W0707
+                "Error loading %s: godot_parser does not support binary scenes"
+                % filepath
+            )
+        if "\r" in contents:
+            # Same newline translation that text mode does
+            contents = contents.replace("\r\n", "\n").replace("\r", "\n")
+        file = cls.parse(contents)
         file.project_root = find_project_root(filepath)
         return file
 
     @classmethod
     def from_parser(cls: Type[GDFileType], parse_result):
-        first_section = parse_result[0]
-        if first_section.header.name == "gd_scene":
-            scene = GDScene.__new__(GDScene)
-            scene._sections = list(parse_result)
-            return scene
-        elif first_section.header.name == "gd_resource":
-            resource = GDResource.__new__(GDResource)
-            resource._sections = list(parse_result)
-            return resource
-        return cls(*parse_result)
+        file_cls = _FILE_BY_HEADER.get(parse_result[0].header.name)
+        if file_cls is None:
+            return cls(*parse_result)
+        file = file_cls.__new__(file_cls)
+        file._sections = list(parse_result)
+        return file
 
     def write(self, filename: str):
         """Writes this to a file"""
         os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "w", encoding="utf-8") as ofile:
-            ofile.write(str(self))
+        with open(filename, "w", encoding="utf-8", buffering=FILE_BUFFER_SIZE) as ofile:
+            # Write each section as we go instead of building the whole file in memory
+            for i, section in enumerate(self._sections):
+                if i:
+                    ofile.write("\n\n")
+                ofile.write(str(section))
+            ofile.write("\n")
 
     def __str__(self) -> str:
-        return "\n\n".join([str(s) for s in self._sections]) + "\n"
+        return "\n\n".join(map(str, self._sections)) + "\n"
 
     def __repr__(self) -> str:
         return "%s(%s)" % (type(self).__name__, self.__str__())
@@ -347,7 +422,11 @@ class GDFile(object):
     def __eq__(self, other) -> bool:
         if not isinstance(other, GDFile):
             return False
-        return self._sections == other._sections
+        a, b = self._sections, other._sections
+        if len(a) != len(b):
+            return False
+        # Files built from the same tree often share section objects
+        return all(x is y or x == y for x, y in zip(a, b))
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
@@ -360,8 +439,8 @@ class GDCommonFile(GDFile):
         super().__init__(
             GDSection(GDSectionHeader(name, load_steps=1, format=2)), *sections
         )
-        self.load_steps = (
-            1 + len(self.get_ext_resources()) + len(self.get_sub_resources())
+        self.load_steps = 1 + sum(
+            1 for s in self._sections if s.header.name in RESOURCE_SECTIONS
         )
 
     @property
@@ -374,14 +453,15 @@ class GDCommonFile(GDFile):
 
     def add_section(self, new_section: GDSection) -> int:
         idx = super().add_section(new_section)
-        if new_section.header.name in ["ext_resource", "sub_resource"]:
+        if new_section.header.name in RESOURCE_SECTIONS:
             self.load_steps += 1
         return idx
 
-    def remove_at(self, index: int):
-        section = self._sections.pop(index)
-        if section.header.name in ["ext_resource", "sub_resource"]:
+    def remove_at(self, index: int) -> GDSection:
+        section = super().remove_at(index)
+        if section.header.name in RESOURCE_SECTIONS:
             self.load_steps -= 1
+        return section
 
     def remove_unused_resources(self):
         self._remove_unused_resources(self.get_ext_resources(), ExtResource)
@@ -392,60 +472,68 @@ class GDCommonFile(GDFile):
         sections: Sequence[Union[GDExtResourceSection, GDSubResourceSection]],
         reference_type: Type[Union[ExtResource, SubResource]],
     ) -> None:
+        if not sections:
+            return
+        resource_ids = {s.id for s in sections}
         seen = set()
         for ref in self._iter_node_resource_references():
-            if isinstance(ref, reference_type):
+            if isinstance(ref, reference_type) and ref.id in resource_ids:
                 seen.add(ref.id)
-        if len(seen) < len(sections):
-            to_remove = [s for s in sections if s.id not in seen]
-            for s in to_remove:
-                self.remove_section(s)
+                if len(seen) == len(resource_ids):
+                    # Everything is in use, no need to look at the rest of the file
+                    return
+        # Rebuild the section list once instead of removing the sections one by one
+        to_remove = {id(s) for s in sections if s.id not in seen}
+        self._sections = [s for s in self._sections if id(s) not in to_remove]
+        self.load_steps -= len(to_remove)
 
     def renumber_resource_ids(self):
         """Refactor all resource IDs to be sequential with no gaps"""
-        self._renumber_resource_ids(self.get_ext_resources(), ExtResource)
-        self._renumber_resource_ids(self.get_sub_resources(), SubResource)
+        ext_id_map = self._renumber_resource_ids(self.get_ext_resources())
+        sub_id_map = self._renumber_resource_ids(self.get_sub_resources())
+
+        # Now we update all references to use the new number. Both kinds are updated in
+        # one pass so we only have to walk the file once.
+        for ref in self._iter_node_resource_references():
+            id_map = ext_id_map if isinstance(ref, ExtResource) else sub_id_map
+            try:
+                ref.id = id_map[ref.id]
+            except KeyError as e:
+                raise GodotFileException("Unknown resource ID %d" % ref.id) from e
 
     def _iter_node_resource_references(
         self,
     ) -> Iterator[Union[ExtResource, SubResource]]:
-        def iter_resources(value):
+        # Walk the values with an explicit stack instead of recursive generators
+        stack: List[Any] = []
+        for node in self.get_nodes():
+            stack.append(node.header.attributes)
+            stack.append(node.properties)
+        for resource in self.get_sections("resource"):
+            stack.append(resource.properties)
+        while stack:
+            value = stack.pop()
+            if type(value) in SCALAR_TYPES:
+                continue
             if isinstance(value, (ExtResource, SubResource)):
                 yield value
             elif isinstance(value, list):
-                for v in value:
-                    yield from iter_resources(v)
+                stack.extend(value)
             elif isinstance(value, dict):
-                for v in value.values():
-                    yield from iter_resources(v)
+                stack.extend(value.values())
             elif isinstance(value, GDObject):
-                for v in value.args:
-                    yield from iter_resources(v)
-
-        for node in self.get_nodes():
-            yield from iter_resources(node.header.attributes)
-            yield from iter_resources(node.properties)
-        for resource in self.get_sections("resource"):
-            yield from iter_resources(resource.properties)
+                stack.extend(value.args)
 
     def _renumber_resource_ids(
         self,
         sections: Sequence[Union[GDExtResourceSection, GDSubResourceSection]],
-        reference_type: Type[Union[ExtResource, SubResource]],
-    ) -> None:
+    ) -> Dict[int, int]:
+        """Renumber the resource IDs so there are no gaps and return old -> new"""
         id_map = {}
-        # First we renumber all the resource IDs so there are no gaps
         for i, section in enumerate(sections):
             id_map[section.id] = i + 1
             section.id = i + 1
-
-        # Now we update all references to use the new number
-        for ref in self._iter_node_resource_references():
-            if isinstance(ref, reference_type):
-                try:
-                    ref.id = id_map[ref.id]
-                except KeyError as e:
-                    raise GodotFileException("Unknown resource ID %d" % ref.id) from e
+        return id_map
 
 
 class GDScene(GDCommonFile):
@@ -456,3 +544,10 @@ class GDScene(GDCommonFile):
 class GDResource(GDCommonFile):
     def __init__(self, *sections: GDSection) -> None:
         super().__init__("gd_resource", *sections)
+
+
+# Maps the name of the first section in a file to the class for that file
+_FILE_BY_HEADER: Dict[str, Type[GDFile]] = {
+    "gd_scene": GDScene,
+    "gd_resource": GDResource,
+}
@@ -1,6 +1,6 @@
 """ Wrappers for Godot's non-primitive object types """
 
-from functools import partial
+import sys
 from typing import Type, TypeVar
 
 from .util import stringify_object
@@ -44,6 +44,8 @@ class GDObject(metaclass=GDObjectMeta):
         GDObject('Vector2', 1, 2) == Vector2(1, 2)
     """
 
+    __slots__ = ("name", "args")
+
     def __init__(self, name, *args) -> None:
         self.name = name
         self.args = list(args)
@@ -51,7 +53,11 @@ class GDObject(metaclass=GDObjectMeta):
     @classmethod
     def from_parser(cls: Type[GDObjectType], parse_result) -> GDObjectType:
         name = parse_result[0]
-        factory = GD_OBJECT_REGISTRY.get(name, partial(GDObject, name))
+        factory = GD_OBJECT_REGISTRY.get(name)
+        if factory is None:
+            # Types without a class of their own (PoolRealArray, Rect2, ...) repeat
+            # throughout a file, so share one copy of each name
+            return GDObject(sys.intern(name), *parse_result[1:])  # type: ignore
         return factory(*parse_result[1:])
 
     def __str__(self) -> str:
@@ -73,6 +79,8 @@ class GDObject(metaclass=GDObjectMeta):
 
 
 class Vector2(GDObject):
+    __slots__ = ()
+
     def __init__(self, x: float, y: float) -> None:
         super().__init__("Vector2", x, y)
 
@@ -104,6 +112,8 @@ class Vector2(GDObject):
 
 
 class Vector3(GDObject):
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, z: float) -> None:
         super().__init__("Vector3", x, y, z)
 
@@ -145,6 +155,8 @@ class Vector3(GDObject):
 
 
 class Color(GDObject):
+    __slots__ = ()
+
     def __init__(self, r: float, g: float, b: float, a: float) -> None:
         assert 0 <= r <= 1
         assert 0 <= g <= 1
@@ -200,6 +212,8 @@ class Color(GDObject):
 
 
 class NodePath(GDObject):
+    __slots__ = ()
+
     def __init__(self, path: str) -> None:
         super().__init__("NodePath", path)
 
@@ -218,6 +232,8 @@ class NodePath(GDObject):
 
 
 class ExtResource(GDObject):
+    __slots__ = ()
+
     def __init__(self, id: int) -> None:
         super().__init__("ExtResource", id)
 
@@ -233,6 +249,8 @@ class ExtResource(GDObject):
 
 
 class SubResource(GDObject):
+    __slots__ = ()
+
     def __init__(self, id: int) -> None:
         super().__init__("SubResource", id)
 
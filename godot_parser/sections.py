@@ -1,5 +1,5 @@
 import re
-from collections import OrderedDict
+import sys
 from typing import Any, List, Optional, Type, TypeVar
 
 from .objects import ExtResource, SubResource
@@ -17,6 +17,9 @@ __all__ = [
 
 GD_SECTION_REGISTRY = {}
 
+# Splits CamelCase into words
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
 
 class GDSectionHeader(object):
     """
@@ -27,11 +30,13 @@ class GDSectionHeader(object):
         [node name="Sprite" type="Sprite" index="3"]
     """
 
+    __slots__ = ("name", "attributes")
+
     def __init__(self, _name: str, **kwargs) -> None:
-        self.name = _name
-        self.attributes = OrderedDict()
-        for k, v in kwargs.items():
-            self.attributes[k] = v
+        # Names from the parser are fresh strings. Interning them lets comparisons
+        # against the section name literals short-circuit on identity.
+        self.name = sys.intern(_name)
+        self.attributes = dict(kwargs)
 
     def __getitem__(self, k: str) -> Any:
         return self.attributes[k]
@@ -51,8 +56,7 @@ class GDSectionHeader(object):
     @classmethod
     def from_parser(cls: Type["GDSectionHeader"], parse_result) -> "GDSectionHeader":
         header = cls(parse_result[0])
-        for attribute in parse_result[1:]:
-            header.attributes[attribute[0]] = attribute[1]
+        header.attributes = dict(parse_result[1:])
         return header
 
     def __str__(self) -> str:
@@ -67,6 +71,8 @@ class GDSectionHeader(object):
         return "GDSectionHeader(%s)" % self.__str__()
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, GDSectionHeader):
             return False
         return self.name == other.name and self.attributes == other.attributes
@@ -81,7 +87,7 @@ class GDSectionMeta(type):
     def __new__(cls, name, bases, dct):
         x = super().__new__(cls, name, bases, dct)
         section_name_camel = name[2:-7]
-        section_name = re.sub(r"(?<!^)(?=[A-Z])", "_", section_name_camel).lower()
+        section_name = CAMEL_CASE_BOUNDARY.sub("_", section_name_camel).lower()
         GD_SECTION_REGISTRY[section_name] = x
         return x
 
@@ -100,11 +106,11 @@ class GDSection(metaclass=GDSectionMeta):
 
     """
 
+    __slots__ = ("header", "properties")
+
     def __init__(self, header: GDSectionHeader, **kwargs) -> None:
         self.header = header
-        self.properties = OrderedDict()
-        for k, v in kwargs.items():
-            self.properties[k] = v
+        self.properties = dict(kwargs)
 
     def __getitem__(self, k: str) -> Any:
         return self.properties[k]
@@ -127,9 +133,7 @@ class GDSection(metaclass=GDSectionMeta):
         factory = GD_SECTION_REGISTRY.get(header.name, cls)
         section = factory.__new__(factory)
         section.header = header
-        section.properties = OrderedDict()
-        for k, v in parse_result[1:]:
-            section[k] = v
+        section.properties = dict(parse_result[1:])
         return section
 
     def __str__(self) -> str:
@@ -147,9 +151,16 @@ class GDSection(metaclass=GDSectionMeta):
         return "%s(%s)" % (type(self).__name__, self.__str__())
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, GDSection):
             return False
-        return self.header == other.header and self.properties == other.properties
+        # Comparing the number of properties is cheaper than comparing the headers
+        return (
+            len(self.properties) == len(other.properties)
+            and self.header == other.header
+            and self.properties == other.properties
+        )
 
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
@@ -158,6 +169,8 @@ class GDSection(metaclass=GDSectionMeta):
 class GDExtResourceSection(GDSection):
     """Section representing an [ext_resource]"""
 
+    __slots__ = ()
+
     def __init__(self, path: str, type: str, id: int):
         super().__init__(GDSectionHeader("ext_resource", path=path, type=type, id=id))
 
@@ -193,6 +206,8 @@ class GDExtResourceSection(GDSection):
 class GDSubResourceSection(GDSection):
     """Section representing a [sub_resource]"""
 
+    __slots__ = ()
+
     def __init__(self, type: str, id: int, **kwargs):
         super().__init__(GDSectionHeader("sub_resource", type=type, id=id), **kwargs)
 
@@ -220,6 +235,8 @@ class GDSubResourceSection(GDSection):
 class GDNodeSection(GDSection):
     """Section representing a [node]"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -330,5 +347,7 @@ class GDNodeSection(GDSection):
 class GDResourceSection(GDSection):
     """Represents a [resource] section"""
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(GDSectionHeader("resource"), **kwargs)
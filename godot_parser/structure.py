@@ -1,11 +1,16 @@
 """ The grammar of the larger structures in the GD file format """
 
+import re
+import sys
+from typing import Any, List, Tuple
+
 from pyparsing import (
     DelimitedList,
     Empty,
     Group,
     LineEnd,
     Opt,
+    ParseException,
     QuotedString,
     Suppress,
     Word,
@@ -13,11 +18,10 @@ from pyparsing import (
 )
 
 from .sections import GDSection, GDSectionHeader
-from .values import value
+from .values import _skip, parse_value, value
 
-key = QuotedString('"', escChar="\\", multiline=False).set_name("key") | Word(
-    alphanums + "_/:"
-).set_name("key")
+quoted_key = QuotedString('"', escChar="\\", multiline=False).set_name("key")
+key = quoted_key | Word(alphanums + "_/:").set_name("key")
 var = Word(alphanums + "_").set_name("variable")
 attribute = Group(var + Suppress("=") + value)
 
@@ -51,3 +55,85 @@ section = (
 # Exports
 
 scene_file = DelimitedList(section, Empty())
+
+# The grammar above is still the reference for the file format, but running the whole
+# file through pyparsing spends most of its time dispatching between grammar elements.
+# The section and entry structure is regular enough to scan by hand, and the values
+# go through the matching hand-written scanner in values.py. test_parser checks that
+# parse_scene_file and scene_file agree.
+
+_LINE_END = re.compile(r"[ \t\r]*(?:\n|\Z)")
+_VAR = re.compile(r"[A-Za-z0-9_]+")
+_KEY = re.compile(r"[A-Za-z0-9_/:]+")
+
+
+def _expect(text: str, loc: int, char: str) -> int:
+    loc = _skip(text, loc)
+    if not text.startswith(char, loc):
+        raise ParseException(text, loc, "Expected %r" % char)
+    return loc + 1
+
+
+def _expect_line_end(text: str, loc: int) -> int:
+    match = _LINE_END.match(text, loc)
+    if match is None:
+        raise ParseException(text, loc, "Expected end of line")
+    return match.end()
+
+
+def _parse_section_header(text: str, loc: int) -> Tuple[int, GDSectionHeader]:
+    loc = _expect(text, loc, "[")
+    match = _VAR.match(text, _skip(text, loc))
+    if match is None:
+        raise ParseException(text, loc, "Expected section type")
+    parse_result: List[Any] = [match.group()]
+    loc = match.end()
+    while True:
+        match = _VAR.match(text, _skip(text, loc))
+        if match is None:
+            break
+        try:
+            attr_loc = _expect(text, match.end(), "=")
+            attr_loc, attr_value = parse_value(text, attr_loc)
+        except ParseException:
+            break
+        # The same few attribute names and property keys repeat across every section
+        parse_result.append((sys.intern(match.group()), attr_value))
+        loc = attr_loc
+    loc = _expect(text, loc, "]")
+    return _expect_line_end(text, loc), GDSectionHeader.from_parser(parse_result)
+
+
+def _parse_section_entry(text: str, loc: int) -> Tuple[int, Tuple[str, Any]]:
+    loc = _skip(text, loc)
+    match = _KEY.match(text, loc)
+    if match is not None:
+        entry_key = sys.intern(match.group())
+        loc = match.end()
+    else:
+        loc, tokens = quoted_key._parse(text, loc)  # pylint: disable=W0212
+        entry_key = tokens[0]
+    loc = _expect(text, loc, "=")
+    loc, entry_value = parse_value(text, loc)
+    return _expect_line_end(text, loc), (entry_key, entry_value)
+
+
+def parse_scene_file(text: str) -> List[GDSection]:
+    """Parse a whole file into sections. Equivalent to scene_file with parse_all=True"""
+    # pyparsing expands tabs before parsing, so do the same to get the same values
+    text = text.expandtabs()
+    sections = []
+    loc = _skip(text, 0)
+    while True:
+        loc, header = _parse_section_header(text, loc)
+        parse_result: List[Any] = [header]
+        while True:
+            try:
+                loc, entry = _parse_section_entry(text, loc)
+            except ParseException:
+                break
+            parse_result.append(entry)
+        sections.append(GDSection.from_parser(parse_result))
+        loc = _skip(text, loc)
+        if loc == len(text):
+            return sections
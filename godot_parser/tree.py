@@ -1,6 +1,5 @@
 """ Helper API for working with the Godot scene tree structure """
-from collections import OrderedDict
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from .files import GDFile
 from .sections import GDNodeSection
@@ -21,6 +20,19 @@ class Node(object):
     a tree structure instead of the flat list that the file format demands.
     """
 
+    __slots__ = (
+        "_name",
+        "_type",
+        "_instance",
+        "_parent",
+        "_index",
+        "section",
+        "_groups",
+        "properties",
+        "_children",
+        "_inherited_node",
+    )
+
     _children: List["Node"]
     _parent: Optional["Node"]
     _index: Optional[int]
@@ -41,9 +53,7 @@ class Node(object):
         self._index = None
         self.section = section or GDNodeSection(name)
         self._groups = groups
-        self.properties = (
-            OrderedDict() if properties is None else OrderedDict(properties)
-        )
+        self.properties = {} if properties is None else dict(properties)
         self._children = []  # type: ignore
         self._inherited_node: Optional["Node"] = None
 
@@ -58,7 +68,7 @@ class Node(object):
 
     def clone(self) -> "Node":
         return Node(
-            self.name, self.type, self.instance, properties=OrderedDict(self.properties)
+            self.name, self.type, self.instance, properties=dict(self.properties)
         )
 
     @property
@@ -151,39 +161,89 @@ class Node(object):
         Write values to GDNodeSection and iterate over children
 
         This call will copy the existing values on this node into the GDNodeSection and
-        iterate over self and all child nodes, calling flatten on them as well.
+        iterate over self and all child nodes, updating their sections as well.
         """
-
-        self._update_section(path)
-
-        yield self
+        return self._flatten(path, False)
+
+    def _flatten(self, path: Optional[str], skip_unchanged_inherited: bool):
+        # Walk with an explicit stack; deep scenes would otherwise stack up one
+        # generator per level, and every yielded node passes through all of them
+        stack = [(self, path)]
+        while stack:
+            node, path = stack.pop()
+            # Inherited nodes without overrides don't get written to the file, but their
+            # children might
+            if not (
+                skip_unchanged_inherited
+                and node._inherited_node is not None
+                and not node.properties
+                and node._parent is not None
+            ):
+                node._update_section(path)
+                yield node
+            node._assign_child_indexes()
+            child_path = node._child_path(path)
+            stack.extend((child, child_path) for child in reversed(node._children))
+
+    def _child_path(self, path: Optional[str]) -> str:
+        """Get the parent path of this node's children, given this node's parent path"""
         if path is None:
-            child_path = "."
+            return "."
         elif path == ".":
-            child_path = self.name
-        else:
-            child_path = path + "/" + self.name
-        child_idx = 0
+            return self.name
+        return path + "/" + self.name
+
+    def _assign_child_indexes(self) -> None:
         # Assign an index to children if we were assigned one, or if we are the root
         # node of an inherited scene
-        use_index = self._index is not None or (
+        if self._index is not None or (
             self.parent is None and self._instance is not None
-        )
-        for child in self._children:
-            if use_index:
+        ):
+            for child_idx, child in enumerate(self._children):
                 child._index = child_idx
-                child_idx += 1
-            yield from child.flatten(child_path)
+
+    def _update_position(self) -> None:
+        """
+        Write the parent path and index that flatten() would give this node
+
+        Unlike flatten(), this leaves the rest of the section and the rest of the tree
+        alone.
+        """
+        ancestors = []
+        node = self.parent
+        while node is not None:
+            ancestors.append(node)
+            node = node.parent
+        path = None
+        for node in reversed(ancestors):
+            node._assign_child_indexes()
+            path = node._child_path(path)
+        section = self.section
+        if section.parent != path:
+            section.parent = path
+        if self._index is not None and section.index != self._index:
+            section.index = self._index
 
     def _update_section(self, path: Optional[str] = None) -> None:
-        self.section.name = self.name
-        self.section.type = self._type
-        self.section.parent = path
-        self.section.instance = self._instance
-        self.section.groups = self._groups
-        self.section.properties = self.properties
-        if self._index is not None:
-            self.section.index = self._index
+        # Only write the values that changed. Most nodes come back from the tree
+        # unchanged, and the setters do more work than the comparisons (setting the
+        # instance builds a new ExtResource and clears the type).
+        section = self.section
+        if section.name != self.name:
+            section.name = self.name
+        # The section can't have both, and setting an instance clears the type
+        node_type = self._type if self._instance is None else None
+        if section.type != node_type:
+            section.type = node_type
+        if section.parent != path:
+            section.parent = path
+        if section.instance != self._instance:
+            section.instance = self._instance
+        if section.groups != self._groups:
+            section.groups = self._groups
+        section.properties = self.properties
+        if self._index is not None and section.index != self._index:
+            section.index = self._index
 
     @property
     def is_inherited(self) -> bool:
@@ -208,13 +268,14 @@ class Node(object):
 
     def get_node(self, path: str) -> Optional["Node"]:
         """Mimics the Godot get_node() behavior"""
-        if path in (".", ""):
-            return self
-        pieces = path.split("/")
-        child = self.get_child(pieces[0])
-        if child is None:
-            return None
-        return child.get_node("/".join(pieces[1:]))
+        node = self
+        while path not in (".", ""):
+            name, _, path = path.partition("/")
+            child = node.get_child(name)
+            if child is None:
+                return None
+            node = child
+        return node
 
     def add_child(self, node: "Node") -> None:
         """Add a child to the current node"""
@@ -226,14 +287,17 @@ class Node(object):
         self._children.insert(index, node)
         node._parent = self
 
-    def _merge_child(self, section: GDNodeSection) -> None:
-        """Add a child that may be an inherited node"""
-        for child in self._children:
-            if child.name == section.name:
-                child.section = section
-                child.properties = section.properties
-                return
-        self.add_child(Node.from_section(section))
+    def _merge_child(
+        self, section: GDNodeSection, existing: Optional["Node"] = None
+    ) -> "Node":
+        """Add a child that may be an inherited node, given the child it would replace"""
+        if existing is not None:
+            existing.section = section
+            existing.properties = section.properties
+            return existing
+        child = Node.from_section(section)
+        self.add_child(child)
+        return child
 
     def remove_from_parent(self) -> None:
         """Remove this node from its parent"""
@@ -296,6 +360,21 @@ class Tree(object):
     def build(cls, file: GDFile):
         """Build the Tree from a flat list of [node]'s"""
         tree = cls()
+        # Maps id(node) -> child name -> first child with that name, so that merging a
+        # section doesn't scan the siblings. Nothing else can touch the tree while it's
+        # being built, so unlike an index on the nodes themselves this can't go stale.
+        children_by_name: Dict[int, Dict[str, Node]] = {}
+        # Remember the node each parent path resolved to. The tree only grows while
+        # it's being built, so a path that resolved once keeps resolving to that node.
+        nodes_by_path: Dict[str, Node] = {}
+
+        def get_node(path: str) -> Optional[Node]:
+            node = tree.root
+            while node is not None and path not in (".", ""):
+                name, _, path = path.partition("/")
+                node = children_by_name[id(node)].get(name)
+            return node
+
         # Makes assumptions that the nodes are well-ordered
         for section in file.get_nodes():
             if section.parent is None:
@@ -303,26 +382,42 @@ class Tree(object):
                 tree.root = root
                 if root.instance is not None:
                     _load_parent_scene(root, file)
+                children_by_name = _index_children(root)
+                nodes_by_path = {}
             else:
-                parent = tree.get_node(section.parent)
+                parent = nodes_by_path.get(section.parent)
                 if parent is None:
-                    raise TreeMutationException(
-                        "Cannot find parent node %s of %s"
-                        % (section.parent, section.name)
-                    )
-                parent._merge_child(section)
+                    parent = get_node(section.parent)
+                    if parent is None:
+                        raise TreeMutationException(
+                            "Cannot find parent node %s of %s"
+                            % (section.parent, section.name)
+                        )
+                    nodes_by_path[section.parent] = parent
+                siblings = children_by_name[id(parent)]
+                child = parent._merge_child(section, siblings.get(section.name))
+                siblings.setdefault(section.name, child)
+                children_by_name.setdefault(id(child), {})
         return tree
 
+    def get_section(self, path: str) -> Optional[GDNodeSection]:
+        """
+        Get the GDNodeSection for a node without flattening the whole tree
+
+        The section is given the parent path and index that flatten() would give it, but
+        nothing else is written to it.
+        """
+        node = self.get_node(path)
+        if node is None:
+            return None
+        node._update_position()
+        return node.section
+
     def flatten(self) -> List[GDNodeSection]:
         """Flatten the tree back into a list of GDNodeSection"""
-        ret: List[GDNodeSection] = []
         if self.root is None:
-            return ret
-        for node in self.root.flatten():
-            if node.is_inherited and not node.has_changes and node.parent is not None:
-                continue
-            ret.append(node.section)
-        return ret
+            return []
+        return [node.section for node in self.root._flatten(None, True)]
 
 
 def _load_parent_scene(root: Node, file: GDFile):
@@ -332,7 +427,24 @@ def _load_parent_scene(root: Node, file: GDFile):
     for child in parent_tree.root.get_children():
         root.add_child(child)
     # Mark the entire parent tree as inherited
-    for node in parent_tree.root.flatten():
+    stack = [parent_tree.root]
+    while stack:
+        node = stack.pop()
         node._mark_inherited()
+        stack.extend(node.get_children())
     # Mark the root node as inherited
     root._inherited_node = parent_tree.root
+
+
+def _index_children(root: Node) -> Dict[int, Dict[str, Node]]:
+    """Map id(node) -> child name -> first child with that name for a whole tree"""
+    children_by_name: Dict[int, Dict[str, Node]] = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        names: Dict[str, Node] = {}
+        for child in node.get_children():
+            names.setdefault(child.name, child)
+        children_by_name[id(node)] = names
+        stack.extend(node.get_children())
+    return children_by_name
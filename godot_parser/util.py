@@ -1,6 +1,6 @@
 """ Utils """
-import json
 import os
+from json.encoder import encode_basestring_ascii
 from typing import Optional
 
 
@@ -9,7 +9,8 @@ def stringify_object(value):
     if value is None:
         return "null"
     elif isinstance(value, str):
-        return json.dumps(value)
+        # What json.dumps does for a str, minus the encoder setup on every call
+        return encode_basestring_ascii(value)
     elif isinstance(value, bool):
         return "true" if value else "false"
     elif isinstance(value, dict):
@@ -30,13 +31,18 @@ def find_project_root(start: str) -> Optional[str]:
     curdir = start
     if os.path.isfile(start):
         curdir = os.path.dirname(start)
+    if os.path.isfile(os.path.join(curdir, "project.godot")):
+        return curdir
+    # Resolve symlinks once up front. The parent of a resolved path is just its dirname,
+    # so there's no need to resolve every ancestor along the way.
+    curdir = os.path.realpath(curdir)
     while True:
-        if os.path.isfile(os.path.join(curdir, "project.godot")):
-            return curdir
-        next_dir = os.path.realpath(os.path.join(curdir, os.pardir))
+        next_dir = os.path.dirname(curdir)
         if next_dir == curdir:
             return None
         curdir = next_dir
+        if os.path.isfile(os.path.join(curdir, "project.godot")):
+            return curdir
 
 
 def gdpath_to_filepath(root: str, path: str) -> str:
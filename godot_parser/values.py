@@ -1,5 +1,8 @@
 """ The grammar of low-level values in the GD file format """
 
+import re
+from typing import Any, Callable, Dict, List, Tuple
+
 from pyparsing import (
     DelimitedList,
     Forward,
@@ -24,9 +27,10 @@ boolean = (
 
 null = Keyword("null").set_parse_action(lambda _: [None])
 
-
+# Each alternative here and in value below can be told apart by its first character,
+# so the order only affects speed. The most common ones come first.
 primitive = (
-    null | QuotedString('"', escChar="\\", multiline=True) | boolean | common.number
+    common.number | QuotedString('"', escChar="\\", multiline=True) | boolean | null
 )
 value = Forward()
 
@@ -59,4 +63,149 @@ dict_ = (
 
 # Exports
 
-value <<= primitive | list_ | dict_ | obj_type
+value <<= primitive | obj_type | list_ | dict_
+
+
+# The grammar above is the reference, but pyparsing spends most of its time
+# dispatching between alternatives. parse_value below does the same job with one
+# branch per leading character. Anything it isn't sure about (escape sequences, syntax
+# errors, ...) is handed back to the grammar, so both always agree.
+
+
+class _Unhandled(Exception):
+    """Raised when the hand-written scanner defers to the grammar"""
+
+
+_WHITESPACE = re.compile(r"[ \n\t\r]*")
+# Same alternatives, in the same order, as common.number. Group 1 is signed_integer.
+_NUMBER = re.compile(
+    r"[+-]?(?:\d+(?:[eE][+-]?\d+)|(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?|(\d+))"
+)
+_WORD = re.compile(r"[A-Za-z][0-9A-Za-z]*")
+_KEYWORDS = {"null": None, "true": True, "false": False}
+_KEYWORD_CHARS = frozenset(Keyword.DEFAULT_KEYWORD_CHARS)
+
+
+def _skip(text: str, loc: int) -> int:
+    return _WHITESPACE.match(text, loc).end()  # type: ignore
+
+
+def _scan_string(text: str, loc: int, multiline: bool = True) -> Tuple[int, str]:
+    end = text.find('"', loc + 1)
+    if end < 0:
+        raise _Unhandled()
+    contents = text[loc + 1 : end]
+    if "\\" in contents or (not multiline and ("\n" in contents or "\r" in contents)):
+        raise _Unhandled()
+    return end + 1, contents
+
+
+def _scan_number(text: str, loc: int) -> Tuple[int, Any]:
+    match = _NUMBER.match(text, loc)
+    if match is None:
+        raise _Unhandled()
+    if match.group(1) is None:
+        return match.end(), float(match.group())
+    return match.end(), int(match.group())
+
+
+def _scan_word(text: str, loc: int) -> Tuple[int, Any]:
+    match = _WORD.match(text, loc)
+    name = match.group()  # type: ignore
+    end = match.end()  # type: ignore
+    if name in _KEYWORDS:
+        if text[end : end + 1] in _KEYWORD_CHARS or (
+            loc > 0 and text[loc - 1] in _KEYWORD_CHARS
+        ):
+            raise _Unhandled()
+        return end, _KEYWORDS[name]
+    loc = _skip(text, end)
+    if not text.startswith("(", loc):
+        raise _Unhandled()
+    loc, arg = _scan_value(text, loc + 1)
+    parse_result = [name, arg]
+    while True:
+        loc = _skip(text, loc)
+        char = text[loc : loc + 1]
+        if char == ")":
+            return loc + 1, GDObject.from_parser(parse_result)
+        if char != ",":
+            raise _Unhandled()
+        loc, arg = _scan_value(text, loc + 1)
+        parse_result.append(arg)
+
+
+def _scan_list(text: str, loc: int) -> Tuple[int, List[Any]]:
+    ret: List[Any] = []
+    loc = _skip(text, loc + 1)
+    if text.startswith(",", loc):
+        loc = _skip(text, loc + 1)
+    elif not text.startswith("]", loc):
+        while True:
+            loc, item = _scan_value(text, loc)
+            ret.append(item)
+            loc = _skip(text, loc)
+            if not text.startswith(",", loc):
+                break
+            loc = _skip(text, loc + 1)
+            if text.startswith("]", loc):
+                break
+    if not text.startswith("]", loc):
+        raise _Unhandled()
+    return loc + 1, ret
+
+
+def _scan_dict(text: str, loc: int) -> Tuple[int, Dict[str, Any]]:
+    ret: Dict[str, Any] = {}
+    loc = _skip(text, loc + 1)
+    if not text.startswith("}", loc):
+        while True:
+            if not text.startswith('"', loc):
+                raise _Unhandled()
+            loc, key = _scan_string(text, loc, multiline=False)
+            loc = _skip(text, loc)
+            if not text.startswith(":", loc):
+                raise _Unhandled()
+            loc, ret[key] = _scan_value(text, loc + 1)
+            loc = _skip(text, loc)
+            if not text.startswith(",", loc):
+                break
+            loc = _skip(text, loc + 1)
+    if not text.startswith("}", loc):
+        raise _Unhandled()
+    return loc + 1, ret
+
+
+_SCANNERS: Dict[str, Callable[[str, int], Tuple[int, Any]]] = {
+    '"': _scan_string,
+    "[": _scan_list,
+    "{": _scan_dict,
+}
+_SCANNERS.update(dict.fromkeys("+-.0123456789", _scan_number))
+_SCANNERS.update(dict.fromkeys(alphas, _scan_word))
+
+
+def _scan_value(text: str, loc: int) -> Tuple[int, Any]:
+    loc = _skip(text, loc)
+    scanner = _SCANNERS.get(text[loc : loc + 1])
+    if scanner is None:
+        raise _Unhandled()
+    return scanner(text, loc)
+
+
+def parse_value(text: str, loc: int = 0) -> Tuple[int, Any]:
+    """Parse a single value starting at loc. Returns the end location and the value"""
+    try:
+        return _scan_value(text, loc)
+    except _Unhandled:
+        loc, tokens = value._parse(text, loc)  # pylint: disable=W0212
+        return loc, tokens[0]
+
+
+# value._parse skips the streamline() that parse_string does first, so do it once here.
+# Packrat parsing (ParserElement.enable_packrat) made these grammars 2-3x slower back
+# when whole files went through pyparsing, with or without a cache size limit. They
+# rarely backtrack, so the cache costs more than it saves, and it is global pyparsing
+# state that would affect any other grammar in the process. Leave it to the
+# application to decide.
+value.streamline()
@@ -1,45 +1,73 @@
 #!/usr/bin/env python
 import argparse
+import difflib
 import os
 import sys
-from itertools import zip_longest
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
 
-from godot_parser import load, parse
+from godot_parser import parse
+from godot_parser.util import find_project_root
 
 
-def _parse_and_test_file(filename: str) -> bool:
-    print("Parsing %s" % filename)
+def _parse_and_test_file(filename: str) -> Tuple[bool, str]:
+    """Returns whether the file passed, and the report to print for it"""
+    # The report is returned instead of printed so that parallel jobs don't interleave
+    # their output
+    output = ["Parsing %s" % filename]
     with open(filename, "r") as ifile:
         contents = ifile.read()
     try:
         data = parse(contents)
     except Exception:
-        print("  Parsing error!")
-        import traceback
+        output.append("  Parsing error!")
+        output.append(traceback.format_exc().rstrip("\n"))
+        return False, "\n".join(output)
 
-        traceback.print_exc()
-        return False
+    parsed = str(data)
+    # Most files come back byte for byte, and then there's no need to compare by line
+    if parsed != contents:
+        data_lines = [l for l in parsed.split("\n") if l]
+        content_lines = [l for l in contents.split("\n") if l]
+        if data_lines != content_lines:
+            output.append("  Error!")
+            output.extend(
+                difflib.unified_diff(
+                    content_lines, data_lines, "original", "parsed", lineterm=""
+                )
+            )
+            return False, "\n".join(output)
 
-    f = load(filename)
-    with f.use_tree() as tree:
+    # The comparison is done, so the parsed file can be reused to exercise the tree
+    # instead of reading and parsing it a second time with load()
+    data.project_root = find_project_root(filename)
+    with data.use_tree() as tree:
         pass
+    return True, "\n".join(output)
 
-    data_lines = [l for l in str(data).split("\n") if l]
-    content_lines = [l for l in contents.split("\n") if l]
-    if data_lines != content_lines:
-        print("  Error!")
-        max_len = max([len(l) for l in content_lines])
-        if max_len < 100:
-            for orig, parsed in zip_longest(content_lines, data_lines, fillvalue=""):
-                c = " " if orig == parsed else "x"
-                print("%s <%s> %s" % (orig.ljust(max_len), c, parsed))
-        else:
-            for orig, parsed in zip_longest(
-                content_lines, data_lines, fillvalue="----EMPTY----"
-            ):
-                c = "    " if orig == parsed else "XXX)"
-                print("%s\n%s%s" % (orig, c, parsed))
-        return False
+
+def _parse_and_test_files(filepaths: List[str], jobs: int) -> bool:
+    """Stops at the first file that fails"""
+    if jobs <= 1:
+        for filepath in filepaths:
+            passed, output = _parse_and_test_file(filepath)
+            print(output)
+            if not passed:
+                return False
+        return True
+    # Every file is independent, and parsing them is CPU bound. Reports are printed
+    # in order as the files finish.
+    with ProcessPoolExecutor(jobs) as executor:
+        futures = [executor.submit(_parse_and_test_file, f) for f in filepaths]
+        for future in futures:
+            passed, output = future.result()
+            print(output)
+            if not passed:
+                # Don't wait for the files that haven't started yet
+                for pending in futures:
+                    pending.cancel()
+                return False
     return True
 
 
@@ -47,18 +75,26 @@ def main():
     """Test the parsing of one tscn file or all files in directory"""
     parser = argparse.ArgumentParser(description=main.__doc__)
     parser.add_argument("file_or_dir", help="Parse file or files under this directory")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes to parse files with (default %(default)s)",
+    )
     args = parser.parse_args()
     if os.path.isfile(args.file_or_dir):
-        _parse_and_test_file(args.file_or_dir)
+        print(_parse_and_test_file(args.file_or_dir)[1])
     else:
+        filepaths = []
         for root, _dirs, files in os.walk(args.file_or_dir, topdown=False):
             for file in files:
                 ext = os.path.splitext(file)[1]
                 if ext not in [".tscn", ".tres"]:
                     continue
-                filepath = os.path.join(root, file)
-                if not _parse_and_test_file(filepath):
-                    sys.exit(1)
+                filepaths.append(os.path.join(root, file))
+        if not _parse_and_test_files(filepaths, args.jobs):
+            sys.exit(1)
 
 
 if __name__ == "__main__":
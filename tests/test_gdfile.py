@@ -1,7 +1,20 @@
+import os
 import tempfile
 import unittest
 
-from godot_parser import GDFile, GDObject, GDResource, GDResourceSection, GDScene, Node
+from godot_parser import (
+    ExtResource,
+    GDFile,
+    GDObject,
+    GDResource,
+    GDResourceSection,
+    GDScene,
+    GDSection,
+    GDSectionHeader,
+    Node,
+    SubResource,
+)
+from godot_parser.files import GodotFileException
 
 
 class TestGDFile(unittest.TestCase):
@@ -129,6 +142,29 @@ visible = false
         self.assertTrue(result)
         self.assertEqual(len(scene.get_sections()), 0)
 
+    def test_remove_section_identity(self):
+        """remove_section prefers the exact section, but accepts an equal one"""
+        scene = GDFile()
+        res1 = GDResourceSection()
+        res2 = GDResourceSection()
+        scene.add_section(res1)
+        scene.add_section(res2)
+        self.assertTrue(scene.remove_section(res2))
+        self.assertEqual(len(scene.get_sections()), 1)
+        self.assertIs(scene.get_sections()[0], res1)
+        self.assertTrue(scene.remove_section(GDResourceSection()))
+        self.assertEqual(scene.get_sections(), [])
+
+    def test_get_sections_after_rename(self):
+        """get_sections sees changes to the section headers"""
+        scene = GDScene()
+        sub = scene.add_sub_resource("CircleShape2D")
+        sub.header.name = "resource"
+        self.assertEqual(scene.get_sections("sub_resource"), [])
+        self.assertEqual(scene.get_sections("resource"), [sub])
+        sub.header = GDSectionHeader("sub_resource", type="CircleShape2D", id=1)
+        self.assertEqual(scene.get_sub_resources(), [sub])
+
     def test_section_ordering(self):
         """Sections maintain an ordering"""
         scene = GDScene()
@@ -137,6 +173,26 @@ visible = false
         res = scene.find_section("ext_resource")
         self.assertEqual(scene.get_sections()[1:], [res, node])
 
+    def test_section_ordering_stable(self):
+        """Sections of the same type keep the order they were added in"""
+        scene = GDScene()
+        node = scene.add_node("RootNode")
+        res1 = scene.add_ext_resource("res://Other.tscn", "PackedScene")
+        sub = scene.add_sub_resource("CircleShape2D")
+        res2 = scene.add_ext_resource("res://Another.tscn", "PackedScene")
+        self.assertEqual(scene.get_sections()[1:], [res1, res2, sub, node])
+        scene.remove_section(res1)
+        res3 = scene.add_ext_resource("res://Third.tscn", "PackedScene")
+        self.assertEqual(scene.get_sections()[1:], [res2, res3, sub, node])
+
+    def test_section_ordering_unknown(self):
+        """Unknown section types sort to the end"""
+        scene = GDScene()
+        custom = GDSection(GDSectionHeader("custom"))
+        self.assertEqual(scene.add_section(custom), 1)
+        node = scene.add_node("RootNode")
+        self.assertEqual(scene.get_sections()[1:], [node, custom])
+
     def test_add_ext_node(self):
         """Test GDScene.add_ext_node"""
         scene = GDScene()
@@ -148,12 +204,25 @@ visible = false
     def test_write(self):
         """Test writing scene out to a file"""
         scene = GDScene()
-        outfile = tempfile.mkstemp()[1]
-        scene.write(outfile)
-        with open(outfile, "r", encoding="utf-8") as ifile:
-            gen_scene = GDScene.parse(ifile.read())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            outfile = os.path.join(tmpdir, "Scene.tscn")
+            scene.write(outfile)
+            with open(outfile, "r", encoding="utf-8") as ifile:
+                gen_scene = GDScene.parse(ifile.read())
         self.assertEqual(scene, gen_scene)
 
+    def test_load_crlf(self):
+        """Loading a file with Windows line endings"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "Scene.tscn")
+            with open(filename, "wb") as ofile:
+                ofile.write(
+                    b'[gd_scene load_steps=1 format=2]\r\n\r\n[node name="Root" '
+                    b'type="Label"]\r\ntext = "Hello\r\nWorld"\r\n'
+                )
+            scene = GDScene.load(filename)
+        self.assertEqual(scene.find_node(name="Root")["text"], "Hello\nWorld")
+
     def test_get_node_none(self):
         """get_node() works with no nodes"""
         scene = GDScene()
@@ -184,6 +253,20 @@ visible = false
         self.assertEqual(node["texture_map"]["tex"], s.reference)
         self.assertEqual(node["texture_pool"].args[0], s.reference)
 
+    def test_next_resource_id(self):
+        """New resource ids account for ids that were changed after adding"""
+        scene = GDScene()
+        res = scene.add_ext_resource("res://Res.tscn", "PackedScene")
+        res.id = 10
+        res2 = scene.add_ext_resource("res://Sprite.png", "Texture")
+        self.assertEqual(res2.id, 11)
+        scene.remove_section(res2)
+        res3 = scene.add_ext_resource("res://Sprite.png", "Texture")
+        self.assertEqual(res3.id, 11)
+        res3.header.attributes["id"] = 20
+        res4 = scene.add_ext_resource("res://Icon.png", "Texture")
+        self.assertEqual(res4.id, 21)
+
     def test_remove_unused_resource(self):
         """Can remove unused resources"""
         scene = GDScene()
@@ -192,6 +275,23 @@ visible = false
         resources = scene.get_sections("ext_resource")
         self.assertEqual(len(resources), 0)
 
+    def test_remove_some_unused_resources(self):
+        """Removing unused resources keeps the used ones"""
+        scene = GDScene()
+        scene.add_ext_resource("res://Res.tscn", "PackedScene")
+        used = scene.add_ext_resource("res://Sprite.png", "Texture")
+        scene.add_sub_resource("CircleShape2D")
+        shape = scene.add_sub_resource("RectangleShape2D")
+        node = scene.add_node("Sprite", "Sprite")
+        node["texture"] = used.reference
+        node["shapes"] = [{"shape": shape.reference}]
+        self.assertEqual(scene.load_steps, 5)
+        scene.remove_unused_resources()
+        self.assertEqual(scene.get_ext_resources(), [used])
+        self.assertEqual(scene.get_sub_resources(), [shape])
+        self.assertEqual(scene.get_sections()[1:], [used, shape, node])
+        self.assertEqual(scene.load_steps, 3)
+
     def test_addremove_sub_res(self):
         """Test adding and removing a sub_resource"""
         scene = GDResource()
@@ -210,6 +310,26 @@ visible = false
         self.assertEqual(s.id, 1)
         self.assertEqual(resource["shape"], s.reference)
 
+    def test_renumber_resource_ids(self):
+        """Renumbering updates ext_resource and sub_resource references together"""
+        scene = GDScene()
+        ext1 = scene.add_ext_resource("res://Res.tscn", "PackedScene")
+        ext2 = scene.add_ext_resource("res://Sprite.png", "Texture")
+        sub1 = scene.add_sub_resource("CircleShape2D")
+        sub2 = scene.add_sub_resource("RectangleShape2D")
+        node = scene.add_node("Sprite", "Sprite")
+        node["texture"] = ext2.reference
+        node["shape"] = sub2.reference
+        scene.remove_section(ext1)
+        scene.remove_section(sub1)
+        scene.renumber_resource_ids()
+        self.assertEqual((ext2.id, sub2.id), (1, 1))
+        self.assertEqual(node["texture"], ExtResource(1))
+        self.assertEqual(node["shape"], SubResource(1))
+
+        node["missing"] = ExtResource(5)
+        self.assertRaises(GodotFileException, scene.renumber_resource_ids)
+
     def test_find_constraints(self):
         """Test for the find_section constraints"""
         scene = GDScene()
@@ -225,6 +345,24 @@ visible = false
         found = list(scene.find_all("sub_resource", {"radius": 2}))
         self.assertEqual(found, [res2])
 
+    def test_find_by_id(self):
+        """Finding resources by id sees resources added, removed, and changed"""
+        scene = GDScene()
+        res1 = scene.add_ext_resource("res://Res.tscn", "PackedScene")
+        res2 = scene.add_ext_resource("res://Sprite.png", "Texture")
+        self.assertEqual(scene.find_ext_resource(id=2), res2)
+        self.assertEqual(scene.find_ext_resource(id=2, type="Texture"), res2)
+        self.assertIsNone(scene.find_ext_resource(id=2, type="PackedScene"))
+        res1.id = 2
+        self.assertEqual(list(scene.find_all("ext_resource", id=2)), [res1, res2])
+        scene.remove_section(res1)
+        self.assertEqual(scene.find_ext_resource(id=2), res2)
+        res3 = scene.add_ext_resource("res://Other.tscn", "PackedScene")
+        self.assertEqual(scene.find_ext_resource(id=3), res3)
+        self.assertIsNone(scene.find_ext_resource(id=4))
+        res3.header.attributes["id"] = 7
+        self.assertEqual(scene.find_ext_resource(id=7), res3)
+
     def test_find_node(self):
         """Test GDScene.find_node"""
         scene = GDScene()
@@ -234,6 +372,9 @@ visible = false
         self.assertEqual(node, n1)
         node = scene.find_node(parent=".")
         self.assertEqual(node, n2)
+        n2.name = "Renamed"
+        self.assertIsNone(scene.find_node(name="Child"))
+        self.assertEqual(scene.find_node(name="Renamed"), n2)
 
     def test_file_equality(self):
         """Tests for GDFile == GDFile"""
@@ -3,7 +3,16 @@ import unittest
 
 from pyparsing import ParseException
 
-from godot_parser import GDFile, GDObject, GDSection, GDSectionHeader, Vector2, parse
+from godot_parser import (
+    GDFile,
+    GDObject,
+    GDScene,
+    GDSection,
+    GDSectionHeader,
+    Vector2,
+    parse,
+)
+from godot_parser.structure import parse_scene_file, scene_file
 
 HERE = os.path.dirname(__file__)
 
@@ -110,6 +119,31 @@ TEST_CASES = [
             )
         ),
     ),
+    (
+        """[resource]
+    escaped = "say \\"hi\\"\\n"
+    empty = [ ]
+    trailing = [ 1, -2.5, 1e3, ]
+    nested = { "a": [ {
+    } ], "b": true }
+    """,
+        GDFile(
+            GDSection(
+                GDSectionHeader("resource"),
+                escaped='say "hi"\n',
+                empty=[],
+                trailing=[1, -2.5, 1000.0],
+                nested={"a": [{}], "b": True},
+            )
+        ),
+    ),
+    ("[resource]\nvalue = Vector2( )", "error"),
+    ("[resource]\nvalue = [ 1, , 2 ]", "error"),
+    ('[resource]\nvalue = { "a": 1, }', "error"),
+    ("[gd_scene load_steps=5 format=2", "error"),
+    ("[node name=]", "error"),
+    ("[resource]\nvalue = 1 2", "error"),
+    ("[resource] value = 1", "error"),
 ]
 
 
@@ -119,28 +153,47 @@ class TestParser(unittest.TestCase):
 
     def _run_test(self, string: str, expected):
         """Run a set of tests"""
+        if expected == "error":
+            with self.assertRaises(
+                ParseException, msg="Parsing '%s' should have failed" % string
+            ):
+                parse(string)
+            return
         try:
             parse_result = parse(string)
-            if expected == "error":
-                assert False, "Parsing '%s' should have failed.\nGot: %s" % (
-                    string,
-                    parse_result,
-                )
-            else:
-                self.assertEqual(parse_result, expected)
         except ParseException as e:
-            if expected != "error":
-                print(string)
-                print(" " * e.loc + "^")
-                print(str(e))
-                raise
-        except AssertionError:
-            print("Parsing : %s" % string)
-            print("Expected: %r" % expected)
-            print("Got     : %r" % parse_result)
+            print(string)
+            print(" " * e.loc + "^")
+            print(str(e))
             raise
+        self.assertEqual(parse_result, expected)
+
+    def test_empty(self):
+        """Parsing an empty file returns an empty file"""
+        self.assertEqual(parse(""), GDFile())
+        self.assertEqual(parse("\n  \n"), GDFile())
+        with self.assertRaises(ParseException):
+            GDScene.parse("")
+        with self.assertRaises(ParseException):
+            parse("\x0b")
 
     def test_cases(self):
         """Run the parsing test cases"""
-        for string, expected in TEST_CASES:
-            self._run_test(string, expected)
+        for i, (string, expected) in enumerate(TEST_CASES):
+            with self.subTest(i=i):
+                self._run_test(string, expected)
+
+    def test_reference_grammar(self):
+        """parse_scene_file agrees with the pyparsing grammar"""
+        for i, (string, expected) in enumerate(TEST_CASES):
+            with self.subTest(i=i):
+                if expected == "error":
+                    with self.assertRaises(ParseException):
+                        scene_file.parse_string(string, parse_all=True)
+                    with self.assertRaises(ParseException):
+                        parse_scene_file(string)
+                else:
+                    self.assertEqual(
+                        parse_scene_file(string),
+                        list(scene_file.parse_string(string, parse_all=True)),
+                    )
@@ -2,8 +2,15 @@ import os
 import shutil
 import tempfile
 import unittest
-
-from godot_parser import GDScene, Node, SubResource, TreeMutationException
+from unittest import mock
+
+from godot_parser import (
+    GDScene,
+    GDSectionHeader,
+    Node,
+    SubResource,
+    TreeMutationException,
+)
 from godot_parser.util import find_project_root, gdpath_to_filepath
 
 
@@ -19,6 +26,14 @@ class TestTree(unittest.TestCase):
         child = scene.add_node("Child2", parent="Child")
         node = scene.get_node("Child/Child2")
         self.assertEqual(node, child)
+        self.assertIs(scene.get_node("Child/Child2/"), child)
+        self.assertIs(scene.get_node(), scene.find_node(name="RootNode"))
+        self.assertIsNone(scene.get_node("Child2"))
+        self.assertIsNone(scene.get_node("./Child"))
+        self.assertIsNone(scene.get_node("Child/./Child2"))
+        with scene.use_tree() as tree:
+            self.assertIsNone(tree.get_node("./Child"))
+            self.assertIsNone(tree.get_node("Child/./Child2"))
 
     def test_remove_node(self):
         """Test for remove_node()"""
@@ -71,6 +86,52 @@ class TestTree(unittest.TestCase):
         idx2 = scene.get_sections().index(child2)
         self.assertLess(idx2, idx1)
 
+    def test_get_child_after_mutation(self):
+        """get_child() should see renamed, added, and removed children"""
+        root = Node("RootNode")
+        child = Node("Child")
+        root.add_child(child)
+        self.assertIs(root.get_child("Child"), child)
+        child.name = "Renamed"
+        self.assertIsNone(root.get_child("Child"))
+        self.assertIs(root.get_child("Renamed"), child)
+        other = Node("Other")
+        root.get_children().append(other)
+        self.assertIs(root.get_child("Other"), other)
+        root.remove_child("Renamed")
+        self.assertIsNone(root.get_child("Renamed"))
+        duplicate = Node("Other")
+        root.add_child(duplicate)
+        self.assertIs(root.get_child("Other"), other)
+        replacement = Node("Replacement")
+        root.get_children()[0] = replacement
+        self.assertIs(root.get_child("Other"), duplicate)
+        self.assertIs(root.get_child("Replacement"), replacement)
+        root.get_children().remove(replacement)
+        root.get_children().append(other)
+        self.assertIsNone(root.get_child("Replacement"))
+        self.assertIs(root.get_child("Other"), duplicate)
+
+    def test_unchanged_tree(self):
+        """Flattening an unchanged tree does not rewrite the node headers"""
+        scene = GDScene()
+        scene.add_node("RootNode")
+        scene.add_node("Child", type="Node2D", parent=".")
+        setitem = mock.patch.object(
+            GDSectionHeader,
+            "__setitem__",
+            autospec=True,
+            side_effect=GDSectionHeader.__setitem__,
+        )
+        with setitem as mock_setitem:
+            with scene.use_tree():
+                pass
+            mock_setitem.assert_not_called()
+            with scene.use_tree() as tree:
+                tree.get_node("Child").type = "Sprite"
+            mock_setitem.assert_called()
+        self.assertEqual(scene.find_node(type="Sprite").name, "Child")
+
     def test_empty_scene(self):
         """Empty scenes should not crash"""
         scene = GDScene()
@@ -180,6 +241,37 @@ flip_h = true
             self.assertIsNotNone(node)
             self.assertEqual(node.type, "TextureProgress")
 
+    def test_get_node_inherited(self):
+        """get_node on an inherited scene does not change the file"""
+        scene = GDScene.load(self.leaf_scene)
+        before = str(scene)
+        node = scene.get_node("Health/LifeBar")
+        self.assertIsNotNone(node)
+        self.assertEqual(node.parent, "Health")
+        self.assertEqual(node.index, 0)
+        self.assertEqual(scene.get_node("Health").index, 2)
+        self.assertEqual(scene.get_node("CollisionShape2D").index, 0)
+        self.assertEqual(scene.get_node("Sprite"), scene.find_node(name="Sprite"))
+        self.assertIsNone(scene.get_node("Missing"))
+        self.assertEqual(str(scene), before)
+
+    def test_get_node_inherited_index(self):
+        """get_node gives nodes from the file the same index as flattening would"""
+        scene = GDScene.load(self.mid_scene)
+        new = scene.add_node("New", type="Control", parent="Health")
+        self.assertIsNone(new.index)
+        self.assertIs(scene.get_node("Health/New"), new)
+        self.assertEqual(new.index, 1)
+        self.assertEqual(scene.get_node("Health").index, 2)
+        self.assertEqual(scene.get_node("Health/LifeBar").index, 0)
+
+    def test_readonly_tree(self):
+        """Changes to a readonly tree are not written back to the file"""
+        scene = GDScene.load(self.leaf_scene)
+        with scene.use_tree(readonly=True) as tree:
+            tree.root.add_child(Node("NewChild", type="Control"))
+        self.assertIsNone(scene.find_node(name="NewChild"))
+
     def test_add_new_nodes(self):
         """Can add new nodes to an inherited scene"""
         scene = GDScene.load(self.leaf_scene)